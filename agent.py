@@ -7,19 +7,8 @@ from modules.optimized_language_detector import OptimizedLanguageDetector
 from modules.optimized_extractor import OptimizedTravelExtractor
 from modules.optimized_classifier import OptimizedInquiryClassifier
 from modules.optimized_excel_generator import OptimizedExcelGenerator
-from utils.email_fetcher import fetch_live_emails
-from utils.email_sender import GmailEmailSender
 
  
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('travel_agent.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +17,9 @@ class TravelAgentProcessor:
     Main processor for travel inquiries with hybrid ML + rule-based approach
     """
 
+    # Sentence boundary used to split multi-location text into segments
+    SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]\s+')
+
     def __init__(self):
         """Initialize the travel agent processor"""
         self.language_detector = HybridLanguageDetector()
@@ -190,7 +182,7 @@ class TravelAgentProcessor:
         segments = []
 
         # Try to split by sentences first
-        sentences = re.split(r'[.!?]\s+', text)
+        sentences = self.SENTENCE_SPLIT_PATTERN.split(text)
 
         current_segment = ""
         for sentence in sentences:
@@ -218,6 +210,21 @@ class TravelAgentProcessor:
 
 
 def main():
+    # Configured here rather than at import so final_automated_agent keeps its own handlers
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('travel_agent.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+    # Gmail clients are only needed for live runs; import them here so
+    # importing TravelAgentProcessor stays cheap
+    from utils.email_fetcher import fetch_live_emails
+    from utils.email_sender import GmailEmailSender
+
     processor = TravelAgentProcessor()
     excel_generator = ExcelGenerator()
     mailer = GmailEmailSender()
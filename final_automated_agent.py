@@ -14,7 +14,17 @@ from pathlib import Path
 # Import core modules
 from agent import TravelAgentProcessor
 from modules.excel_generator import ExcelGenerator
-from utils.email_fetcher import fetch_live_emails
+
+
+def load_email_fetcher():
+    """
+    Import the Gmail fetcher on first use so demo mode never loads the
+    Google API client libraries. A successful import is cached in
+    sys.modules; a failed one raises ImportError and is retried next call.
+    """
+    from utils.email_fetcher import fetch_live_emails
+    return fetch_live_emails
+
 
 # Setup comprehensive logging
 def setup_logging():
@@ -39,7 +49,7 @@ def setup_logging():
     
     # File handler
     file_handler = logging.FileHandler(
-        log_dir / f"travel_agent_{datetime.now().strftime('%Y%m%d')}.log"
+        log_dir / time.strftime("travel_agent_%Y%m%d.log")
     )
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
@@ -77,6 +87,13 @@ class FinalAutomatedTravelAgent:
         """
         self.logger.info("Starting continuous email processing...")
         
+        # Fail fast rather than polling forever without a fetcher
+        try:
+            load_email_fetcher()
+        except ImportError as e:
+            self.logger.error("Gmail client libraries unavailable: %s", e)
+            raise
+        
         while True:
             try:
                 self.process_email_batch()
@@ -87,7 +104,7 @@ class FinalAutomatedTravelAgent:
                 self.logger.info("Received shutdown signal. Stopping gracefully...")
                 break
             except Exception as e:
-                self.logger.error(f"Error in processing cycle: {e}")
+                self.logger.error("Error in processing cycle: %s", e)
                 self.logger.info("Waiting 1 minute before retry...")
                 time.sleep(60)
     
@@ -95,28 +112,36 @@ class FinalAutomatedTravelAgent:
         """Process a batch of emails from the inbox"""
         try:
             # Fetch live emails
+            fetch_live_emails = load_email_fetcher()
             live_emails = fetch_live_emails(max_results=10)
             
             if not live_emails:
                 self.logger.info("No new emails found")
                 return
             
-            self.logger.info(f"Processing {len(live_emails)} new emails...")
+            self.logger.info("Processing %d new emails...", len(live_emails))
             
-            # Process each email
+            # Process each email; exact duplicates within the batch (autoresponders,
+            # blasts) share the first copy's result instead of being reprocessed
+            batch_results = {}
             for i, email_data in enumerate(live_emails, 1):
-                self.logger.info(f"Processing email {i}/{len(live_emails)}")
-                result = self.process_single_email(email_data)
+                self.logger.info("Processing email %d/%d", i, len(live_emails))
+                key = (email_data.get('sender', ''), email_data.get('subject', ''), email_data.get('body', ''))
+                if key in batch_results:
+                    self.logger.info("Email %d duplicates an earlier email in this batch", i)
+                    result = batch_results[key]
+                else:
+                    result = batch_results[key] = self.process_single_email(email_data)
                 
                 if result:
-                    self.logger.info(f"Successfully processed inquiry {result.get('inquiry_id')}")
+                    self.logger.info("Successfully processed inquiry %s", result.get('inquiry_id'))
                 else:
-                    self.logger.warning(f"Failed to process email {i}")
+                    self.logger.warning("Failed to process email %d", i)
             
-            self.logger.info(f"Completed batch processing of {len(live_emails)} emails")
+            self.logger.info("Completed batch processing of %d emails", len(live_emails))
             
         except Exception as e:
-            self.logger.error(f"Error in batch processing: {e}")
+            self.logger.error("Error in batch processing: %s", e)
     
     def process_single_email(self, email_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -133,7 +158,7 @@ class FinalAutomatedTravelAgent:
             subject = email_data.get('subject', '')
             sender = email_data.get('sender', '')
             
-            self.logger.info(f"Processing email from {sender} with subject: {subject[:50]}...")
+            self.logger.info("Processing email from %s with subject: %.50s...", sender, subject)
             
             # Process the inquiry
             result = self.processor.process_inquiry(email_data)
@@ -152,7 +177,7 @@ class FinalAutomatedTravelAgent:
             return result
             
         except Exception as e:
-            self.logger.error(f"Error processing single email: {e}")
+            self.logger.error("Error processing single email: %s", e)
             return None
     
     def log_processing_summary(self, result: Dict[str, Any]):
@@ -163,13 +188,21 @@ class FinalAutomatedTravelAgent:
         destinations = result.get('location_details', {}).get('all_destinations', [])
         travelers = result.get('traveler_details', {}).get('total_travelers', 'UNKNOWN')
         
-        self.logger.info(f"PROCESSING SUMMARY:")
-        self.logger.info(f"  Inquiry ID: {inquiry_id}")
-        self.logger.info(f"  Language: {language}")
-        self.logger.info(f"  Type: {inquiry_type}")
-        self.logger.info(f"  Destinations: {', '.join(destinations) if destinations else 'None'}")
-        self.logger.info(f"  Travelers: {travelers}")
-        self.logger.info(f"  Excel: {result.get('excel_path', 'Not generated')}")
+        self.logger.info(
+            "PROCESSING SUMMARY:\n"
+            "  Inquiry ID: %s\n"
+            "  Language: %s\n"
+            "  Type: %s\n"
+            "  Destinations: %s\n"
+            "  Travelers: %s\n"
+            "  Excel: %s",
+            inquiry_id,
+            language,
+            inquiry_type,
+            ', '.join(destinations) if destinations else 'None',
+            travelers,
+            result.get('excel_path', 'Not generated'),
+        )
     
     def run_demo_mode(self):
         """
@@ -193,16 +226,16 @@ class FinalAutomatedTravelAgent:
             }
         ]
         
-        self.logger.info(f"Processing {len(sample_emails)} demo emails...")
+        self.logger.info("Processing %d demo emails...", len(sample_emails))
         
         for i, email_data in enumerate(sample_emails, 1):
-            self.logger.info(f"Processing demo email {i}/{len(sample_emails)}")
+            self.logger.info("Processing demo email %d/%d", i, len(sample_emails))
             result = self.process_single_email(email_data)
             
             if result:
-                self.logger.info(f"Demo email {i} processed successfully")
+                self.logger.info("Demo email %d processed successfully", i)
             else:
-                self.logger.warning(f"Demo email {i} processing failed")
+                self.logger.warning("Demo email %d processing failed", i)
         
         self.logger.info("Demo mode completed")
 
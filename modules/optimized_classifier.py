@@ -2,9 +2,8 @@ import re
 import logging
 from typing import Dict, Any, List
 from modules.schema import InquiryType
+from modules.result_cache import ResultCache
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class OptimizedInquiryClassifier:
@@ -13,8 +12,12 @@ class OptimizedInquiryClassifier:
     Handles: SINGLE_LEG, MULTI_LEG, MODIFICATION
     """
     
+    # Number of (subject, text) classifications kept for repeat calls
+    RESULT_CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize optimized classifier with enhanced patterns"""
+        self.result_cache = ResultCache(self.RESULT_CACHE_SIZE)
         self.setup_classification_patterns()
         logger.info("Optimized Inquiry Classifier initialized")
     
@@ -22,7 +25,7 @@ class OptimizedInquiryClassifier:
         """Setup enhanced classification patterns based on data analysis"""
         
         # SINGLE_LEG indicators - one main destination
-        self.single_leg_patterns = [
+        self.single_leg_patterns = [re.compile(p, re.IGNORECASE) for p in [
             r'trip\s+to\s+(\w+)(?!\s+(?:and|&|\+))',  # trip to Bali (not "and")
             r'planning\s+.*\s+to\s+(\w+)(?!\s+(?:and|&|\+))',
             r'(\w+)\s+ke\s+liye\s+yatra',  # Hindi: destination ke liye yatra
@@ -30,10 +33,10 @@ class OptimizedInquiryClassifier:
             # Subject line patterns for single destination
             r'travel\s+inquiry.*\s+to\s+(\w+)$',
             r'(\w+)\s+trip\s+inquiry',
-        ]
+        ]]
         
         # MULTI_LEG indicators - multiple destinations or locations
-        self.multi_leg_patterns = [
+        self.multi_leg_patterns = [re.compile(p, re.IGNORECASE) for p in [
             # Multiple destinations with &, and, +
             r'(\w+)\s+(?:and|&|\+)\s+(\w+)',
             r'(\w+)\s*,\s*(\w+)',  # Comma separated
@@ -46,10 +49,10 @@ class OptimizedInquiryClassifier:
             r'group.*(\w+).*(\w+)',
             # Travel plans format
             r'travel\s+plans.*(\w+)\s+&\s+(\w+)',
-        ]
+        ]]
         
         # MODIFICATION indicators - changes to existing requests
-        self.modification_patterns = [
+        self.modification_patterns = [re.compile(p, re.IGNORECASE) for p in [
             # Subject line patterns
             r'^re:\s+trip',
             r'^re:\s+.*query',
@@ -69,7 +72,21 @@ class OptimizedInquiryClassifier:
             r'increasing\s+the\s+number',
             r'dates\s+also\s+need\s+to\s+change',
             r'prefer\s+from\s+.*\s+to\s+.*',
-        ]
+        ]]
+        
+        # Each group fused into one alternation, for checks that only need to
+        # know whether any pattern in the group matches
+        self.modification_any_pattern = re.compile(
+            "|".join(f"(?:{pattern.pattern})" for pattern in self.modification_patterns),
+            re.IGNORECASE
+        )
+        self.multi_leg_any_pattern = re.compile(
+            "|".join(f"(?:{pattern.pattern})" for pattern in self.multi_leg_patterns),
+            re.IGNORECASE
+        )
+        
+        # Location-specific sections: "For Singapore, ... For Goa, ..."
+        self.location_section_pattern = re.compile(r'for\s+(\w+),', re.IGNORECASE)
         
         # Known destinations for context
         self.destinations = [
@@ -77,6 +94,11 @@ class OptimizedInquiryClassifier:
             'Alleppey', 'Kochi', 'Chennai', 'Mumbai', 'Delhi', 'Bengaluru',
             'Thailand', 'Malaysia', 'Japan', 'Vietnam', 'Europe', 'USA'
         ]
+        
+        # Known destinations are single words, so a word-boundary match is a
+        # lookup of the lower-cased name among the text's \w+ tokens
+        self.destination_names = [(destination, destination.lower()) for destination in self.destinations]
+        self.token_pattern = re.compile(r'\w+')
     
     def classify_inquiry(self, text: str, subject: str = "") -> Dict[str, Any]:
         """
@@ -89,7 +111,18 @@ class OptimizedInquiryClassifier:
         Returns:
             Dict with classification result and confidence
         """
-        combined_text = f"{subject} {text}".lower()
+        key = (subject, text)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
+        result = self.classify_text(f"{subject} {text}".lower(), subject)
+        
+        self.result_cache.put(key, result)
+        return dict(result)
+    
+    def classify_text(self, combined_text: str, subject: str) -> Dict[str, Any]:
+        """Classify lower-cased subject and body text"""
         
         # Check for MODIFICATION first (highest priority)
         if self.is_modification(combined_text, subject):
@@ -121,17 +154,16 @@ class OptimizedInquiryClassifier:
         """Check if inquiry is a modification request"""
         
         # Check subject line first
-        subject_lower = subject.lower()
-        for pattern in self.modification_patterns:
-            if re.search(pattern, subject_lower, re.IGNORECASE):
-                logger.debug(f"Modification detected in subject: {pattern}")
-                return True
+        match = self.modification_any_pattern.search(subject.lower())
+        if match:
+            logger.debug("Modification detected in subject: %s", match.group(0))
+            return True
         
         # Check body text
-        for pattern in self.modification_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"Modification detected in body: {pattern}")
-                return True
+        match = self.modification_any_pattern.search(text)
+        if match:
+            logger.debug("Modification detected in body: %s", match.group(0))
+            return True
         
         return False
     
@@ -140,67 +172,59 @@ class OptimizedInquiryClassifier:
         
         # Count unique destinations mentioned
         destinations_found = []
-        for destination in self.destinations:
-            if destination.lower() in text:
+        for destination, name in self.destination_names:
+            if name in text:
                 destinations_found.append(destination)
         
         # If 2+ destinations found, likely multi-leg
         if len(destinations_found) >= 2:
-            logger.debug(f"Multiple destinations found: {destinations_found}")
+            logger.debug("Multiple destinations found: %s", destinations_found)
             return True
         
         # Check explicit multi-leg patterns
         for pattern in self.multi_leg_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 groups = match.groups()
                 if len(groups) >= 2:
                     # Ensure both groups are different and look like destinations
                     dest1, dest2 = groups[0], groups[1]
                     if dest1.lower() != dest2.lower() and len(dest1) > 2 and len(dest2) > 2:
-                        logger.debug(f"Multi-leg pattern matched: {dest1} & {dest2}")
+                        logger.debug("Multi-leg pattern matched: %s & %s", dest1, dest2)
                         return True
         
         # Look for location-specific sections (For X... For Y...)
-        location_sections = re.findall(r'for\s+(\w+),', text, re.IGNORECASE)
+        location_sections = self.location_section_pattern.findall(text)
         if len(set(location_sections)) >= 2:
-            logger.debug(f"Multiple location sections: {location_sections}")
+            logger.debug("Multiple location sections: %s", location_sections)
             return True
         
         return False
     
     def extract_destinations_from_classification(self, text: str) -> List[str]:
         """Extract destinations mentioned in text for classification context"""
-        found_destinations = []
-        text_lower = text.lower()
-        
-        for destination in self.destinations:
-            if destination.lower() in text_lower:
-                # Ensure word boundary for accuracy
-                if re.search(rf'\b{re.escape(destination.lower())}\b', text_lower):
-                    found_destinations.append(destination)
+        tokens = set(self.token_pattern.findall(text.lower()))
         
-        return found_destinations
+        return [destination for destination, name in self.destination_names if name in tokens]
     
     def get_classification_confidence(self, inquiry_type: InquiryType, text: str, subject: str = "") -> float:
         """Calculate confidence score for classification"""
         
         if inquiry_type == InquiryType.MODIFICATION:
             # High confidence for clear modification indicators
+            combined_text = f"{subject} {text}"
             modification_indicators = sum(1 for pattern in self.modification_patterns 
-                                        if re.search(pattern, f"{subject} {text}", re.IGNORECASE))
+                                        if pattern.search(combined_text))
             return min(0.98, 0.80 + (modification_indicators * 0.05))
         
         elif inquiry_type == InquiryType.MULTI_LEG:
             # Confidence based on number of destinations and patterns
             destinations_count = len(self.extract_destinations_from_classification(text))
-            pattern_matches = sum(1 for pattern in self.multi_leg_patterns 
-                                if re.search(pattern, text, re.IGNORECASE))
             
             base_confidence = 0.70
             if destinations_count >= 2:
                 base_confidence += 0.20
-            if pattern_matches >= 1:
+            if self.multi_leg_any_pattern.search(text):
                 base_confidence += 0.10
             
             return min(0.95, base_confidence)
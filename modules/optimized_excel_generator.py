@@ -1,11 +1,9 @@
+import io
 import logging
 from pathlib import Path
-from typing import Dict, Any, List
-import xlsxwriter
+from typing import Dict, Any, List, ClassVar
 from datetime import datetime
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class OptimizedExcelGenerator:
@@ -14,6 +12,45 @@ class OptimizedExcelGenerator:
     Generates all required fields from schema with professional formatting
     """
     
+    # Format specs are workbook-independent; each workbook registers them once
+    _FORMAT_SPECS: ClassVar[Dict[str, Dict[str, Any]]] = {
+        'title': {
+            'bold': True, 'font_size': 16, 'align': 'center',
+            'valign': 'vcenter', 'bg_color': '#2E75B6', 'font_color': 'white'
+        },
+        'header': {
+            'bold': True, 'font_size': 12, 'bg_color': '#D9E2F3',
+            'align': 'left', 'valign': 'vcenter', 'border': 1
+        },
+        'label': {
+            'bold': True, 'align': 'right', 'valign': 'vcenter',
+            'bg_color': '#F2F2F2', 'border': 1
+        },
+        'value': {
+            'align': 'left', 'valign': 'vcenter', 'border': 1,
+            'text_wrap': True
+        },
+        'currency': {
+            'align': 'left', 'valign': 'vcenter', 'border': 1,
+            'bg_color': '#E2EFDA'
+        },
+        'date': {
+            'align': 'center', 'valign': 'vcenter', 'border': 1,
+            'bg_color': '#FFF2CC'
+        },
+        'important': {
+            'bold': True, 'align': 'left', 'valign': 'vcenter',
+            'border': 1, 'bg_color': '#FFE6E6'
+        }
+    }
+    
+    # Maps add_field's field_type to a format name; anything else uses 'value'
+    _VALUE_FORMAT_KEYS: ClassVar[Dict[str, str]] = {
+        'currency': 'currency',
+        'date': 'date',
+        'important': 'important',
+    }
+    
     def __init__(self, output_dir: str = "output"):
         """Initialize Excel generator"""
         self.output_dir = Path(output_dir)
@@ -36,8 +73,28 @@ class OptimizedExcelGenerator:
         filename = f"Travel_Inquiry_{inquiry_id}_{inquiry_type}.xlsx"
         filepath = self.output_dir / filename
         
-        # Create workbook and worksheet
-        workbook = xlsxwriter.Workbook(str(filepath))
+        filepath.write_bytes(self.render_inquiry_report(processed_data))
+        logger.info(f"Excel report generated: {filepath}")
+        return str(filepath)
+    
+    def render_inquiry_report(self, processed_data: Dict[str, Any]) -> bytes:
+        """
+        Build the Excel report in memory without touching the filesystem
+        
+        Args:
+            processed_data (Dict): Processed inquiry data
+            
+        Returns:
+            bytes: Contents of the .xlsx file
+        """
+        inquiry_type = processed_data.get('inquiry_type', {}).get('type', 'UNKNOWN')
+        
+        import xlsxwriter  # deferred: only needed once a report is actually written
+        
+        # Create workbook and worksheet; reports are small, so the whole
+        # file is assembled in memory
+        buffer = io.BytesIO()
+        workbook = xlsxwriter.Workbook(buffer, {'in_memory': True})
         worksheet = workbook.add_worksheet('Inquiry Details')
         
         # Setup formatting
@@ -52,53 +109,23 @@ class OptimizedExcelGenerator:
             self.generate_single_leg_report(worksheet, processed_data, formats)
         
         workbook.close()
-        logger.info(f"Excel report generated: {filepath}")
-        return str(filepath)
+        return buffer.getvalue()
     
     def setup_formats(self, workbook) -> Dict[str, Any]:
         """Setup professional Excel formatting"""
-        return {
-            'title': workbook.add_format({
-                'bold': True, 'font_size': 16, 'align': 'center',
-                'valign': 'vcenter', 'bg_color': '#2E75B6', 'font_color': 'white'
-            }),
-            'header': workbook.add_format({
-                'bold': True, 'font_size': 12, 'bg_color': '#D9E2F3',
-                'align': 'left', 'valign': 'vcenter', 'border': 1
-            }),
-            'label': workbook.add_format({
-                'bold': True, 'align': 'right', 'valign': 'vcenter',
-                'bg_color': '#F2F2F2', 'border': 1
-            }),
-            'value': workbook.add_format({
-                'align': 'left', 'valign': 'vcenter', 'border': 1,
-                'text_wrap': True
-            }),
-            'currency': workbook.add_format({
-                'align': 'left', 'valign': 'vcenter', 'border': 1,
-                'bg_color': '#E2EFDA'
-            }),
-            'date': workbook.add_format({
-                'align': 'center', 'valign': 'vcenter', 'border': 1,
-                'bg_color': '#FFF2CC'
-            }),
-            'important': workbook.add_format({
-                'bold': True, 'align': 'left', 'valign': 'vcenter',
-                'border': 1, 'bg_color': '#FFE6E6'
-            })
-        }
+        return {name: workbook.add_format(spec) for name, spec in self._FORMAT_SPECS.items()}
     
     def generate_single_leg_report(self, worksheet, data: Dict[str, Any], formats: Dict[str, Any]):
         """Generate report for single destination inquiry"""
         
         # Set column widths
-        worksheet.set_column('A:A', 25)
-        worksheet.set_column('B:B', 40)
+        worksheet.set_column(0, 0, 25)
+        worksheet.set_column(1, 1, 40)
         
         row = 0
         
         # Title
-        worksheet.merge_range(f'A{row+1}:B{row+1}', 'SINGLE DESTINATION TRAVEL INQUIRY', formats['title'])
+        worksheet.merge_range(row, 0, row, 1, 'SINGLE DESTINATION TRAVEL INQUIRY', formats['title'])
         row += 2
         
         # Basic Information Section
@@ -148,20 +175,20 @@ class OptimizedExcelGenerator:
         
         # Add processing timestamp
         row += 2
-        worksheet.write(f'A{row+1}', 'Report Generated:', formats['label'])
-        worksheet.write(f'B{row+1}', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), formats['date'])
+        worksheet.write_string(row, 0, 'Report Generated:', formats['label'])
+        worksheet.write_string(row, 1, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), formats['date'])
     
     def generate_multi_leg_report(self, worksheet, data: Dict[str, Any], formats: Dict[str, Any]):
         """Generate report for multi-destination inquiry"""
         
         # Set column widths
-        worksheet.set_column('A:A', 25)
-        worksheet.set_column('B:B', 40)
+        worksheet.set_column(0, 0, 25)
+        worksheet.set_column(1, 1, 40)
         
         row = 0
         
         # Title
-        worksheet.merge_range(f'A{row+1}:B{row+1}', 'MULTI-DESTINATION TRAVEL INQUIRY', formats['title'])
+        worksheet.merge_range(row, 0, row, 1, 'MULTI-DESTINATION TRAVEL INQUIRY', formats['title'])
         row += 2
         
         # Basic Information Section
@@ -195,7 +222,7 @@ class OptimizedExcelGenerator:
             
             for i, leg in enumerate(legs, 1):
                 row += 1
-                worksheet.write(f'A{row+1}', f'DESTINATION {i}: {leg.get("destination", "Unknown")}', formats['header'])
+                worksheet.write_string(row, 0, f'DESTINATION {i}: {leg.get("destination", "Unknown")}', formats['header'])
                 row += 1
                 
                 row = self.add_field(worksheet, row, "Location", leg.get('destination', 'N/A'), formats)
@@ -207,20 +234,20 @@ class OptimizedExcelGenerator:
         
         # Add processing timestamp
         row += 2
-        worksheet.write(f'A{row+1}', 'Report Generated:', formats['label'])
-        worksheet.write(f'B{row+1}', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), formats['date'])
+        worksheet.write_string(row, 0, 'Report Generated:', formats['label'])
+        worksheet.write_string(row, 1, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), formats['date'])
     
     def generate_modification_report(self, worksheet, data: Dict[str, Any], formats: Dict[str, Any]):
         """Generate report for modification inquiry"""
         
         # Set column widths
-        worksheet.set_column('A:A', 25)
-        worksheet.set_column('B:B', 40)
+        worksheet.set_column(0, 0, 25)
+        worksheet.set_column(1, 1, 40)
         
         row = 0
         
         # Title
-        worksheet.merge_range(f'A{row+1}:B{row+1}', 'TRAVEL INQUIRY MODIFICATION', formats['title'])
+        worksheet.merge_range(row, 0, row, 1, 'TRAVEL INQUIRY MODIFICATION', formats['title'])
         row += 2
         
         # Basic Information Section
@@ -250,12 +277,12 @@ class OptimizedExcelGenerator:
         
         # Add processing timestamp
         row += 2
-        worksheet.write(f'A{row+1}', 'Report Generated:', formats['label'])
-        worksheet.write(f'B{row+1}', datetime.now().strftime('%Y-%m-%d %H:%M:%S'), formats['date'])
+        worksheet.write_string(row, 0, 'Report Generated:', formats['label'])
+        worksheet.write_string(row, 1, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), formats['date'])
     
     def add_section_header(self, worksheet, row: int, title: str, formats: Dict[str, Any]) -> int:
         """Add a section header"""
-        worksheet.merge_range(f'A{row+1}:B{row+1}', title, formats['header'])
+        worksheet.merge_range(row, 0, row, 1, title, formats['header'])
         return row + 1
     
     def add_field(self, worksheet, row: int, label: str, value: Any, formats: Dict[str, Any], field_type: str = 'normal') -> int:
@@ -270,15 +297,11 @@ class OptimizedExcelGenerator:
             value = 'Not specified'
         
         # Select appropriate format
-        value_format = formats['value']
-        if field_type == 'currency':
-            value_format = formats['currency']
-        elif field_type == 'date':
-            value_format = formats['date']
-        elif field_type == 'important':
-            value_format = formats['important']
-        
-        worksheet.write(f'A{row+1}', label, formats['label'])
-        worksheet.write(f'B{row+1}', str(value), value_format)
+        value_format = formats[self._VALUE_FORMAT_KEYS.get(field_type, 'value')]
+        
+        # Every cell is text; write_string skips write()'s per-cell type,
+        # formula and URL detection (and never turns input into a formula)
+        worksheet.write_string(row, 0, label, formats['label'])
+        worksheet.write_string(row, 1, str(value), value_format)
         
         return row + 1
\ No newline at end of file
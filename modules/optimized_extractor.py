@@ -1,11 +1,10 @@
 import re
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import calendar
+from modules.result_cache import ResultCache
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class OptimizedTravelExtractor:
@@ -14,8 +13,28 @@ class OptimizedTravelExtractor:
     Handles: English, Hindi, Hindi-English, Hinglish
     """
     
+    # Month names (full and abbreviated) to month number
+    MONTH_MAPPING = {
+        'january': 1, 'jan': 1,
+        'february': 2, 'feb': 2,
+        'march': 3, 'mar': 3,
+        'april': 4, 'apr': 4,
+        'may': 5,
+        'june': 6, 'jun': 6,
+        'july': 7, 'jul': 7,
+        'august': 8, 'aug': 8,
+        'september': 9, 'sep': 9,
+        'october': 10, 'oct': 10,
+        'november': 11, 'nov': 11,
+        'december': 12, 'dec': 12,
+    }
+    
+    # Number of (subject, text) extraction results kept for repeat calls
+    RESULT_CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize optimized extractor with comprehensive patterns"""
+        self.result_cache = ResultCache(self.RESULT_CACHE_SIZE)
         self.setup_comprehensive_patterns()
         self.setup_language_mappings()
         logger.info("Optimized Travel Extractor initialized")
@@ -23,22 +42,22 @@ class OptimizedTravelExtractor:
     def setup_comprehensive_patterns(self):
         """Setup comprehensive extraction patterns based on data analysis"""
         
-        # Date patterns - comprehensive coverage
-        self.date_patterns = [
-            # Standard formats: 18 July, 14 May, 02 October
-            r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)',
-            r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)',
-            # Between date ranges
-            r'between\s+(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+and\s+(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)',
-            r'between\s+(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+and\s+(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)',
-            # From-to formats
-            r'from\s+(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+to\s+(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)',
-            # se/tak Hindi patterns
-            r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+se\s+(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)',
-        ]
+        # Month names as prefix-shared alternations (no name is a prefix of
+        # another, so these match exactly what the plain lists would)
+        month = r'(j(?:anuary|u(?:ne|ly))|february|ma(?:rch|y)|a(?:pril|ugust)|september|october|november|december)'
+        month_short = r'(j(?:an|u[nl])|feb|ma[ry]|a(?:pr|ug)|sep|oct|nov|dec)'
+        
+        # Start date patterns: 18 July, 14 May, 02 October. Every range form
+        # ("between X and Y", "from X to Y", "X se Y") contains one of these,
+        # and the first match is always the range's start, so they need no
+        # patterns of their own
+        self.start_date_patterns = [re.compile(p) for p in [
+            r'(\d{1,2})\s+' + month,
+            r'(\d{1,2})\s+' + month_short,
+        ]]
         
         # Traveler patterns - enhanced for adults/children
-        self.traveler_patterns = [
+        self.traveler_patterns = [re.compile(p) for p in [
             # Direct adult/children counts
             r'(\d+)\s+adults?\s*(?:and|&|\+)?\s*(\d+)\s+children?',
             r'(\d+)\s+adults?\s*(?:and|&|\+)?\s*(\d+)\s+child',
@@ -54,19 +73,15 @@ class OptimizedTravelExtractor:
             # Adults only
             r'(\d+)\s+adults?(?!\s+and|\s+&|\s+\+)',
             r'(\d+)\s+वयस्क(?!\s+और)',
-            # Total travelers
-            r'(\d+)\s+travelers?',
-            r'(\d+)\s+travellers?',
-            r'(\d+)\s+pax',
-            r'(\d+)\s+log',
-        ]
+            # Plain totals ("N travelers", "N pax") live in total_traveler_patterns;
+            # they name neither adults nor children, so they never matched here
+        ]]
         
         # Duration patterns - nights/days
-        self.duration_patterns = [
+        self.duration_patterns = [re.compile(p) for p in [
             # Standard night/day format
             r'(\d+)\s+nights?\s*/\s*(\d+)\s+days?',
             r'(\d+)\s+nights?\s+/\s+(\d+)\s+days?',
-            r'(\d+)N\s*/\s*(\d+)D',
             r'(\d+)n\s*/\s*(\d+)d',
             # Just nights or days
             r'(\d+)\s+nights?',
@@ -74,27 +89,29 @@ class OptimizedTravelExtractor:
             # Hindi patterns
             r'(\d+)\s+रात',
             r'(\d+)\s+दिन',
-        ]
+        ]]
         
-        # Budget patterns - Indian currency focus
-        self.budget_patterns = [
+        # Budget patterns - Indian currency focus. The amount uses possessive
+        # quantifiers: nothing after it can start with a digit, ',' or '.',
+        # so giving characters back could never produce a match
+        self.budget_patterns = [re.compile(p) for p in [
             # Per person with rupee symbol
-            r'₹(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:/\s*)?(?:per\s+)?person',
-            r'₹(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:/\s*)?(?:per\s+)?व्यक्ति',
+            r'₹(\d++(?:,\d{3})*+(?:\.\d{2})?+)\s*(?:/\s*)?(?:per\s+)?person',
+            r'₹(\d++(?:,\d{3})*+(?:\.\d{2})?+)\s*(?:/\s*)?(?:per\s+)?व्यक्ति',
             # Around/approximately
-            r'around\s+₹(\d+(?:,\d{3})*(?:\.\d{2})?)',
-            r'approx\s+₹(\d+(?:,\d{3})*(?:\.\d{2})?)',
-            r'~\s*₹(\d+(?:,\d{3})*(?:\.\d{2})?)',
+            r'around\s+₹(\d++(?:,\d{3})*+(?:\.\d{2})?+)',
+            r'approx\s+₹(\d++(?:,\d{3})*+(?:\.\d{2})?+)',
+            r'~\s*₹(\d++(?:,\d{3})*+(?:\.\d{2})?+)',
             # Budget is format
-            r'budget\s+is\s+₹(\d+(?:,\d{3})*(?:\.\d{2})?)',
-            r'budget\s+₹(\d+(?:,\d{3})*(?:\.\d{2})?)',
+            r'budget\s+is\s+₹(\d++(?:,\d{3})*+(?:\.\d{2})?+)',
+            r'budget\s+₹(\d++(?:,\d{3})*+(?:\.\d{2})?+)',
             # Without currency symbol
-            r'budget\s+(?:is\s+)?around\s+(\d+(?:,\d{3})*(?:\.\d{2})?)',
-            r'budget\s+(?:is\s+)?approx\s+(\d+(?:,\d{3})*(?:\.\d{2})?)',
-        ]
+            r'budget\s+(?:is\s+)?around\s+(\d++(?:,\d{3})*+(?:\.\d{2})?+)',
+            r'budget\s+(?:is\s+)?approx\s+(\d++(?:,\d{3})*+(?:\.\d{2})?+)',
+        ]]
         
         # Hotel preference patterns
-        self.hotel_patterns = [
+        self.hotel_patterns = [re.compile(p) for p in [
             # Star ratings with type
             r'(\d+)-star\s+(?:hotel|resort|villa)',
             r'(\d+)\s+star\s+(?:hotel|resort|villa)',
@@ -108,36 +125,31 @@ class OptimizedTravelExtractor:
             r'preferred\s+hotel\s+is\s+([^.]+)',
             r'hotel\s+preference:\s+([^.]+)',
             r'hotel:\s+([^.]+)',
-        ]
+        ]]
         
         # Meal preference patterns
-        self.meal_patterns = [
+        self.meal_patterns = [re.compile(p) for p in [
             r'(all\s+meals?)',
             r'(breakfast\s+only)',
             r'(breakfast\s+and\s+dinner)',
             r'(indian-style\s+dinners?)',
             r'(veg\s+meals?)',
-            r'(breakfast\s+only)',
-            r'with\s+(all\s+meals?)',
-            r'with\s+(breakfast\s+only)',
-            r'with\s+(breakfast\s+and\s+dinner)',
-            r'जिसमें\s+(breakfast\s+only)',
-        ]
+        ]]
         
         # Activity patterns
-        self.activity_patterns = [
+        self.activity_patterns = [re.compile(p) for p in [
             # Specific activities from samples
-            r'(Kintamani\s+sunrise)',
-            r'(Ubud\s+tour)',
-            r'(Tanah\s+Lot\s+temple)',
-            r'(Desert\s+Safari)',
-            r'(Dhow\s+cruise)',
-            r'(Global\s+Village)',
-            r'(Gardens\s+by\s+the\s+Bay)',
-            r'(Sentosa\s+tour)',
-            r'(Marina\s+Bay\s+Sands)',
+            r'(kintamani\s+sunrise)',
+            r'(ubud\s+tour)',
+            r'(tanah\s+lot\s+temple)',
+            r'(desert\s+safari)',
+            r'(dhow\s+cruise)',
+            r'(global\s+village)',
+            r'(gardens\s+by\s+the\s+bay)',
+            r'(sentosa\s+tour)',
+            r'(marina\s+bay\s+sands)',
             r'(beach\s+hopping)',
-            r'(Dudhsagar\s+Falls)',
+            r'(dudhsagar\s+falls)',
             r'(spa\s+session)',
             r'(romantic\s+dinner)',
             r'(snorkeling)',
@@ -145,20 +157,19 @@ class OptimizedTravelExtractor:
             r'activities?:\s*([^.]+)',
             r'include\s+([^.]+(?:tour|safari|cruise|village|bay|falls|session|dinner|snorkeling))',
             r'गतिविधियाँ:\s*([^.]+)',
-        ]
+        ]]
         
         # Flight requirement patterns
-        self.flight_patterns = [
+        self.flight_patterns = [re.compile(p) for p in [
             r'flights?\s+(?:are\s+)?required',
             r'flights?\s+(?:are\s+)?not\s+required',
             r'flights?\s+(?:are\s+)?needed',
             r'flights?\s+(?:are\s+)?not\s+needed',
             r'flights?\s+आवश्यक\s+हैं',
-            r'flights?\s+not\s+required',
-        ]
+        ]]
         
         # Special request patterns
-        self.special_request_patterns = [
+        self.special_request_patterns = [re.compile(p) for p in [
             r'special\s+request:\s*([^.]+)',
             r'special\s+requests?:\s*([^.]+)',
             r'विशेष\s+अनुरोध:\s*([^.]+)',
@@ -167,18 +178,15 @@ class OptimizedTravelExtractor:
             r'(romantic\s+setup)',
             r'(visa\s+assistance)',
             r'(airport\s+pickup)',
-        ]
+        ]]
         
         # Deadline patterns
-        self.deadline_patterns = [
-            r'(ASAP)',
-            r'(by\s+EOD)',
+        self.deadline_patterns = [re.compile(p) for p in [
+            r'(asap)',
+            r'(by\s+eod)',
             r'(by\s+tomorrow)',
             r'within\s+(\d+)\s+days?',
-            r'send\s+.*\s+(ASAP)',
-            r'send\s+.*\s+(by\s+EOD)',
-            r'send\s+.*\s+(by\s+tomorrow)',
-        ]
+        ]]
         
         # Destination patterns - comprehensive Indian/international destinations
         self.destinations = [
@@ -194,6 +202,29 @@ class OptimizedTravelExtractor:
             'Karnataka', 'Mysore', 'Coorg', 'Hampi', 'Chikmagalur',
             'Andhra Pradesh', 'Hyderabad', 'Tirupati', 'Vizag', 'Araku',
         ]
+        
+        # All known destinations as one word-boundary alternation, so a single
+        # scan finds every destination mentioned (longest names first)
+        self.destination_by_name = {destination.lower(): destination for destination in self.destinations}
+        self.destination_pattern = re.compile(
+            r'\b(' + '|'.join(re.escape(name) for name in sorted(self.destination_by_name, key=len, reverse=True)) + r')\b'
+        )
+        
+        # End date patterns, tried in order: "between X and Y Month", "to Y Month", "Y Month tak"
+        self.end_date_patterns = [re.compile(p) for p in [
+            r'between\s+\d{1,2}\s+\w+\s+and\s+(\d{1,2})\s+(\w+)',
+            r'to\s+(\d{1,2})\s+(\w+)',
+            r'(\d{1,2})\s+(\w+)\s+tak',
+        ]]
+        
+        # Explicit total traveler mentions
+        self.total_traveler_patterns = [re.compile(p) for p in [
+            r'(\d+)\s+travelers?',
+            r'(\d+)\s+travellers?',
+            r'(\d+)\s+pax',
+            r'(\d+)\s+log',
+            r'कुल\s+यात्री\s+(\d+)',
+        ]]
     
     def setup_language_mappings(self):
         """Setup language-specific mappings for better extraction"""
@@ -237,14 +268,25 @@ class OptimizedTravelExtractor:
         Returns:
             Dict containing all extracted fields
         """
+        # Extraction is deterministic, so the same email (re-evaluated by the
+        # pipeline or seen twice in a batch) reuses the earlier result
+        key = (subject, text)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            return self.copy_results(cached)
+        
+        # Every extract_* method below expects this lower-cased text, so the
+        # patterns are written in lower case and matched case-sensitively
         combined_text = f"{subject} {text}".lower()
         
+        num_adults, num_children = self.extract_adults_and_children(combined_text)
+        
         results = {
             'start_date': self.extract_start_date(combined_text),
             'end_date': self.extract_end_date(combined_text),
-            'num_adults': self.extract_adults(combined_text),
-            'num_children': self.extract_children(combined_text),
-            'total_travellers': self.extract_total_travelers(combined_text),
+            'num_adults': num_adults,
+            'num_children': num_children,
+            'total_travellers': self.extract_total_travelers(combined_text, num_adults, num_children),
             'destinations': self.extract_destinations(combined_text),
             'total_duration': self.extract_duration(combined_text),
             'hotel_preferences': self.extract_hotel_preferences(combined_text),
@@ -259,128 +301,92 @@ class OptimizedTravelExtractor:
         # Cross-validate and enhance results
         results = self.cross_validate_results(results, combined_text)
         
-        logger.info(f"Extracted fields: {len([k for k, v in results.items() if v is not None])}/14")
-        return results
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Extracted fields: %d/14", sum(1 for v in results.values() if v is not None))
+        
+        self.result_cache.put(key, results)
+        return self.copy_results(results)
+    
+    def copy_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached result so callers can't mutate the cache entry"""
+        return {field: list(value) if isinstance(value, list) else value
+                for field, value in results.items()}
     
     def extract_start_date(self, text: str) -> Optional[str]:
         """Extract start date with multiple format support"""
-        for pattern in self.date_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    groups = match.groups()
-                    if len(groups) >= 2:
-                        day = int(groups[0])
-                        month = groups[1]
-                        # Convert month name to number
-                        month_num = self.month_to_number(month)
-                        if month_num:
-                            return f"{day:02d}/{month_num:02d}/2024"  # Assuming current year
-                except (ValueError, IndexError):
-                    continue
-        
-        # Look for "between" patterns for start date
-        between_pattern = r'between\s+(\d{1,2})\s+(\w+)'
-        match = re.search(between_pattern, text, re.IGNORECASE)
-        if match:
-            day = int(match.group(1))
-            month = match.group(2)
-            month_num = self.month_to_number(month)
-            if month_num:
-                return f"{day:02d}/{month_num:02d}/2024"
-        
+        for pattern in self.start_date_patterns:
+            match = pattern.search(text)
+            if match:
+                day = int(match.group(1))
+                # Convert month name to number (text is already lower-case)
+                month_num = self.MONTH_MAPPING[match.group(2)]
+                return f"{day:02d}/{month_num:02d}/2024"  # Assuming current year
         return None
     
     def extract_end_date(self, text: str) -> Optional[str]:
         """Extract end date from date ranges"""
-        # Look for "and" patterns in date ranges
-        between_pattern = r'between\s+\d{1,2}\s+\w+\s+and\s+(\d{1,2})\s+(\w+)'
-        match = re.search(between_pattern, text, re.IGNORECASE)
-        if match:
-            day = int(match.group(1))
-            month = match.group(2)
-            month_num = self.month_to_number(month)
-            if month_num:
-                return f"{day:02d}/{month_num:02d}/2024"
-        
-        # Look for "to" patterns
-        to_pattern = r'to\s+(\d{1,2})\s+(\w+)'
-        match = re.search(to_pattern, text, re.IGNORECASE)
-        if match:
-            day = int(match.group(1))
-            month = match.group(2)
-            month_num = self.month_to_number(month)
-            if month_num:
-                return f"{day:02d}/{month_num:02d}/2024"
-        
-        # Look for "tak" (Hindi) patterns
-        tak_pattern = r'(\d{1,2})\s+(\w+)\s+tak'
-        match = re.search(tak_pattern, text, re.IGNORECASE)
-        if match:
-            day = int(match.group(1))
-            month = match.group(2)
-            month_num = self.month_to_number(month)
-            if month_num:
-                return f"{day:02d}/{month_num:02d}/2024"
-        
-        return None
-    
-    def extract_adults(self, text: str) -> Optional[int]:
-        """Extract number of adults with high accuracy"""
-        for pattern in self.traveler_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                groups = match.groups()
-                if len(groups) >= 2:
-                    # Pattern with adults and children
-                    try:
-                        adults = int(groups[1]) if 'including' in pattern else int(groups[0])
-                        return adults
-                    except (ValueError, IndexError):
-                        continue
-                elif len(groups) == 1:
-                    # Adults only pattern
-                    if 'adults' in match.group(0).lower() or 'वयस्क' in match.group(0):
-                        try:
-                            return int(groups[0])
-                        except ValueError:
-                            continue
+        for pattern in self.end_date_patterns:
+            match = pattern.search(text)
+            if match:
+                month_num = self.MONTH_MAPPING.get(match.group(2))
+                if month_num:
+                    day = int(match.group(1))
+                    return f"{day:02d}/{month_num:02d}/2024"
         return None
     
-    def extract_children(self, text: str) -> Optional[int]:
-        """Extract number of children with high accuracy"""
+    def extract_adults_and_children(self, text: str) -> Tuple[Optional[int], int]:
+        """
+        Extract adults and children in one walk over the traveler patterns
+        
+        Args:
+            text (str): Lower-cased inquiry text
+            
+        Returns:
+            Tuple of (adults or None, children defaulting to 0)
+        """
+        adults = None
+        children = None
+        
         for pattern in self.traveler_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 groups = match.groups()
-                if len(groups) >= 3:
-                    # Pattern with adults and children
-                    try:
+                matched = match.group(0)
+                
+                if adults is None:
+                    if len(groups) >= 2:
+                        adults = int(groups[1]) if 'including' in pattern.pattern else int(groups[0])
+                    elif 'adults' in matched or 'वयस्क' in matched:
+                        adults = int(groups[0])
+                
+                if children is None:
+                    if len(groups) >= 3:
                         children = int(groups[2])
-                        return children
-                    except (ValueError, IndexError):
-                        continue
-                elif len(groups) == 2 and ('child' in match.group(0).lower() or 'बच्चे' in match.group(0)):
-                    try:
+                    elif len(groups) == 2 and ('child' in matched or 'बच्चे' in matched):
                         children = int(groups[1])
-                        return children
-                    except (ValueError, IndexError):
-                        continue
-        return 0  # Default to 0 if not found
+                
+                # Stop as soon as both have been found
+                if adults is not None and children is not None:
+                    return adults, children
+        
+        return adults, children if children is not None else 0
     
-    def extract_total_travelers(self, text: str) -> Optional[int]:
-        """Extract total number of travelers"""
-        # Look for explicit total mentions
-        total_patterns = [
-            r'(\d+)\s+travelers?',
-            r'(\d+)\s+travellers?',
-            r'(\d+)\s+pax',
-            r'(\d+)\s+log',
-            r'कुल\s+यात्री\s+(\d+)',
-        ]
+    def extract_total_travelers(self, text: str, adults: Optional[int],
+                                children: Optional[int]) -> Optional[int]:
+        """
+        Extract total number of travelers
         
-        for pattern in total_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        Args:
+            text (str): Lower-cased inquiry text
+            adults (Optional[int]): Adults already extracted from text, so the
+                traveler patterns aren't walked a second time
+            children (Optional[int]): Children already extracted from text
+            
+        Returns:
+            Explicit total if mentioned, else adults + children
+        """
+        # Look for explicit total mentions
+        for pattern in self.total_traveler_patterns:
+            match = pattern.search(text)
             if match:
                 try:
                     return int(match.group(1))
@@ -388,8 +394,6 @@ class OptimizedTravelExtractor:
                     continue
         
         # Calculate from adults + children if available
-        adults = self.extract_adults(text)
-        children = self.extract_children(text)
         if adults is not None:
             return adults + (children or 0)
         
@@ -397,22 +401,15 @@ class OptimizedTravelExtractor:
     
     def extract_destinations(self, text: str) -> List[str]:
         """Extract all destinations mentioned in text"""
-        found_destinations = []
-        text_lower = text.lower()
-        
-        for destination in self.destinations:
-            dest_lower = destination.lower()
-            if dest_lower in text_lower:
-                # Ensure word boundary match for accuracy
-                if re.search(rf'\b{re.escape(dest_lower)}\b', text_lower):
-                    found_destinations.append(destination)
+        mentioned = {self.destination_by_name[name] for name in self.destination_pattern.findall(text)}
+        found_destinations = [destination for destination in self.destinations if destination in mentioned]
         
-        return list(set(found_destinations))  # Remove duplicates
+        return list(dict.fromkeys(found_destinations))  # Remove duplicates, keeping order
     
     def extract_duration(self, text: str) -> Optional[str]:
         """Extract trip duration in nights/days format"""
         for pattern in self.duration_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 groups = match.groups()
                 if len(groups) == 2:
@@ -420,11 +417,11 @@ class OptimizedTravelExtractor:
                     days = int(groups[1])
                     return f"{nights} nights / {days} days"
                 elif len(groups) == 1:
-                    if 'night' in match.group(0).lower():
+                    if 'night' in match.group(0):
                         nights = int(groups[0])
                         days = nights + 1
                         return f"{nights} nights / {days} days"
-                    elif 'day' in match.group(0).lower():
+                    elif 'day' in match.group(0):
                         days = int(groups[0])
                         nights = max(1, days - 1)
                         return f"{nights} nights / {days} days"
@@ -433,7 +430,7 @@ class OptimizedTravelExtractor:
     def extract_hotel_preferences(self, text: str) -> Optional[str]:
         """Extract hotel preferences and requirements"""
         for pattern in self.hotel_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) == 1:
                     if match.group(1).isdigit():
@@ -447,7 +444,7 @@ class OptimizedTravelExtractor:
     def extract_meal_preferences(self, text: str) -> Optional[str]:
         """Extract meal plan preferences"""
         for pattern in self.meal_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip() if match.groups() else match.group(0).strip()
         return None
@@ -457,18 +454,18 @@ class OptimizedTravelExtractor:
         activities = []
         
         for pattern in self.activity_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 activity = match.group(1).strip() if match.groups() else match.group(0).strip()
                 activities.append(activity)
         
-        return list(set(activities))  # Remove duplicates
+        return list(dict.fromkeys(activities))  # Remove duplicates, keeping order
     
     def extract_flight_requirement(self, text: str) -> Optional[bool]:
         """Extract flight requirement status"""
         for pattern in self.flight_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                if 'not' in pattern or 'not required' in text.lower():
+            if pattern.search(text):
+                if 'not' in pattern.pattern or 'not required' in text:
                     return False
                 else:
                     return True
@@ -477,7 +474,7 @@ class OptimizedTravelExtractor:
     def extract_budget(self, text: str) -> Optional[str]:
         """Extract budget information with Indian currency focus"""
         for pattern in self.budget_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 amount = match.group(1)
                 # Ensure proper formatting
@@ -492,7 +489,7 @@ class OptimizedTravelExtractor:
         requests = []
         
         for pattern in self.special_request_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 request = match.group(1).strip() if match.groups() else match.group(0).strip()
                 requests.append(request)
@@ -502,29 +499,11 @@ class OptimizedTravelExtractor:
     def extract_deadline(self, text: str) -> Optional[str]:
         """Extract response deadline"""
         for pattern in self.deadline_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip() if match.groups() else match.group(0).strip()
         return None
     
-    def month_to_number(self, month_str: str) -> Optional[int]:
-        """Convert month name to number"""
-        month_mapping = {
-            'january': 1, 'jan': 1,
-            'february': 2, 'feb': 2,
-            'march': 3, 'mar': 3,
-            'april': 4, 'apr': 4,
-            'may': 5,
-            'june': 6, 'jun': 6,
-            'july': 7, 'jul': 7,
-            'august': 8, 'aug': 8,
-            'september': 9, 'sep': 9,
-            'october': 10, 'oct': 10,
-            'november': 11, 'nov': 11,
-            'december': 12, 'dec': 12,
-        }
-        return month_mapping.get(month_str.lower())
-    
     def cross_validate_results(self, results: Dict[str, Any], text: str) -> Dict[str, Any]:
         """Cross-validate and enhance extraction results"""
         
@@ -535,7 +514,8 @@ class OptimizedTravelExtractor:
                 results['total_travellers'] = calculated_total
             elif results['total_travellers'] != calculated_total:
                 # Trust the explicit total if found
-                logger.warning(f"Total travelers mismatch: calculated={calculated_total}, found={results['total_travellers']}")
+                logger.warning("Total travelers mismatch: calculated=%d, found=%d",
+                               calculated_total, results['total_travellers'])
         
         # Enhance hotel preferences if star rating found
         if results['hotel_preferences'] and results['hotel_preferences'].endswith('-star hotel'):
@@ -546,8 +526,8 @@ class OptimizedTravelExtractor:
                 results['hotel_preferences'] = results['hotel_preferences'].replace('hotel', 'resort')
         
         # Enhance meal preferences with context
-        if results['meal_preferences'] and 'indian-style' in text.lower() and 'dinner' in text.lower():
-            if 'indian-style' not in results['meal_preferences'].lower():
+        if results['meal_preferences'] and 'indian-style' in text and 'dinner' in text:
+            if 'indian-style' not in results['meal_preferences']:
                 results['meal_preferences'] += " with Indian-style dinners"
         
         return results
\ No newline at end of file
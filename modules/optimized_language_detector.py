@@ -2,9 +2,8 @@ import re
 import logging
 from typing import Dict, Any
 from collections import Counter
+from modules.result_cache import ResultCache
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class OptimizedLanguageDetector:
@@ -16,48 +15,78 @@ class OptimizedLanguageDetector:
     4. Hinglish (Hindi + English mix)
     """
     
+    # Number of detection results kept for repeated texts
+    RESULT_CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize optimized language detector"""
+        self.result_cache = ResultCache(self.RESULT_CACHE_SIZE)
         self.setup_language_patterns()
         logger.info("Optimized Language Detector initialized")
     
     def setup_language_patterns(self):
         """Setup comprehensive language detection patterns"""
         
-        # Pure Hindi (Devanagari) patterns
-        self.hindi_devanagari_patterns = [
-            r'[\u0900-\u097F]+',  # Devanagari Unicode range
-            r'(विषय|यात्रा|पूछताछ|वयस्क|बच्चे|नमस्ते|धन्यवाद)',
-            r'(के\s+लिए|की\s+यात्रा|में|से|तक|और|या)',
-        ]
+        # Pure Hindi (Devanagari) patterns. Literal words are counted with
+        # str.count rather than a regex, between the run and phrase patterns
+        # so the score adds up in the same order as before
+        self.devanagari_run_pattern = re.compile(r'[\u0900-\u097F]+')
+        self.hindi_devanagari_words = (
+            'विषय', 'यात्रा', 'पूछताछ', 'वयस्क', 'बच्चे', 'नमस्ते', 'धन्यवाद'
+        )
+        self.hindi_phrase_pattern = re.compile(r'(के\s+लिए|की\s+यात्रा|में|से|तक|और|या)')
+        
+        # Word groups are counted against the text's tokens (maximal \w runs,
+        # i.e. exactly what a \b(word)\b pattern matches), so the text is
+        # tokenized once per detection. Each group is a (words, phrase pattern)
+        # pair, where only multi-word phrases still need a regex scan; groups
+        # are scored one at a time, in order, to keep the float sums stable.
+        self.token_pattern = re.compile(r'\w+')
         
         # Hindi words written in English script
-        self.hindi_english_patterns = [
-            r'\b(namaste|namaskar|dhanyawad|shukriya)\b',
-            r'\b(yatra|safar|ghumna|jana)\b',
-            r'\b(vyakti|log|bachhe|vyask)\b',
-            r'\b(ke\s+liye|ki\s+yatra|mein|se|tak|aur)\b',
-            r'\b(paisa|rupaye|budget|kharcha)\b',
-            r'\b(hotel|resort|ghar|jagah)\b',
-        ]
+        self.hindi_english_groups = (
+            (frozenset({'namaste', 'namaskar', 'dhanyawad', 'shukriya'}), None),
+            (frozenset({'yatra', 'safar', 'ghumna', 'jana'}), None),
+            (frozenset({'vyakti', 'log', 'bachhe', 'vyask'}), None),
+            (frozenset({'mein', 'se', 'tak', 'aur'}), re.compile(r'\b(ke\s+liye|ki\s+yatra)\b')),
+            (frozenset({'paisa', 'rupaye', 'budget', 'kharcha'}), None),
+            (frozenset({'hotel', 'resort', 'ghar', 'jagah'}), None),
+        )
         
         # Hinglish patterns (Hindi + English mixed)
-        self.hinglish_patterns = [
-            r'\b(ke\s+liye|chahiye|chahta|hai|hain)\b',
-            r'\b(hamare|humara|client|log|pax)\b',
-            r'\b(jana\s+chahta|trip\s+chahiye|ke\s+liye\s+trip)\b',
-            r'\b(jisme|including|aur|and)\b',
-            r'\b(se|from|tak|to|between)\b',
-            r'\b(dobara|again|update|send)\b',
-        ]
+        self.hinglish_groups = (
+            (frozenset({'chahiye', 'chahta', 'hai', 'hain'}), re.compile(r'\bke\s+liye\b')),
+            (frozenset({'hamare', 'humara', 'client', 'log', 'pax'}), None),
+            (frozenset(), re.compile(r'\b(jana\s+chahta|trip\s+chahiye|ke\s+liye\s+trip)\b')),
+            (frozenset({'jisme', 'including', 'aur', 'and'}), None),
+            (frozenset({'se', 'from', 'tak', 'to', 'between'}), None),
+            (frozenset({'dobara', 'again', 'update', 'send'}), None),
+        )
         
         # Pure English indicators
-        self.english_patterns = [
-            r'\b(hope|well|client|planning|departing|preferred)\b',
-            r'\b(adults|children|travelers|travellers|nights|days)\b',
-            r'\b(hotel|resort|activities|flights|budget|special)\b',
-            r'\b(request|regards|thanks|kindly|please)\b',
-        ]
+        self.english_groups = (
+            (frozenset({'hope', 'well', 'client', 'planning', 'departing', 'preferred'}), None),
+            (frozenset({'adults', 'children', 'travelers', 'travellers', 'nights', 'days'}), None),
+            (frozenset({'hotel', 'resort', 'activities', 'flights', 'budget', 'special'}), None),
+            (frozenset({'request', 'regards', 'thanks', 'kindly', 'please'}), None),
+        )
+        
+        # Formal English constructions
+        self.formal_english_patterns = [re.compile(p) for p in [
+            r'hope\s+you.*well',
+            r'kindly\s+send',
+            r'please\s+\w+',
+            r'would\s+like\s+to',
+            r'we\s+are\s+planning'
+        ]]
+        
+        # Mixed-language vocabulary used for Hinglish detection
+        self.mixed_english_words = frozenset({'client', 'trip', 'hotel', 'budget', 'send', 'update'})
+        self.mixed_hindi_words = frozenset({'hamare', 'chahiye', 'ke', 'liye', 'aur', 'dobara'})
+        
+        # Script detection
+        self.devanagari_char_pattern = re.compile(r'[\u0900-\u097F]')
+        self.english_char_pattern = re.compile(r'[a-zA-Z]')
         
         # Language-specific greetings and closings
         self.language_markers = {
@@ -85,15 +114,32 @@ class OptimizedLanguageDetector:
         Returns:
             Dict containing language detection results
         """
+        # Detection is deterministic, so a text seen before (a retried or
+        # re-quoted email) reuses the earlier result
+        cached = self.result_cache.get(text)
+        if cached is not None:
+            return {**cached, 'scores': dict(cached['scores'])}
+        
         text_lower = text.lower()
         
         # Calculate scores for each language type
-        scores = {
-            'hindi': self.calculate_hindi_score(text, text_lower),
-            'hindi_english': self.calculate_hindi_english_score(text_lower),
-            'hinglish': self.calculate_hinglish_score(text_lower),
-            'english': self.calculate_english_score(text_lower)
-        }
+        if self.english_char_pattern.search(text_lower):
+            word_counts = Counter(self.token_pattern.findall(text_lower))
+            scores = {
+                'hindi': self.calculate_hindi_score(text, text_lower),
+                'hindi_english': self.calculate_hindi_english_score(text_lower, word_counts),
+                'hinglish': self.calculate_hinglish_score(text_lower, word_counts),
+                'english': self.calculate_english_score(text_lower, word_counts)
+            }
+        else:
+            # Every non-Hindi marker, word and pattern is Latin script, so text
+            # without Latin letters (e.g. pure Devanagari) scores 0 on all of them
+            scores = {
+                'hindi': self.calculate_hindi_score(text, text_lower),
+                'hindi_english': 0.0,
+                'hinglish': 0.0,
+                'english': 0.0
+            }
         
         # Determine primary language
         primary_language = max(scores.keys(), key=lambda k: scores[k])
@@ -102,23 +148,29 @@ class OptimizedLanguageDetector:
         # Enhance detection with context analysis
         enhanced_result = self.enhance_detection(text, text_lower, primary_language, scores)
         
-        return {
+        result = {
             'primary_language': enhanced_result['language'],
             'confidence': enhanced_result['confidence'],
             'scores': scores,
             'method': 'pattern_based',
             'details': enhanced_result['details']
         }
+        
+        self.result_cache.put(text, result)
+        return {**result, 'scores': dict(scores)}
     
     def calculate_hindi_score(self, text: str, text_lower: str) -> float:
         """Calculate score for Pure Hindi (Devanagari)"""
         score = 0.0
         
         # Check for Devanagari characters
-        devanagari_chars = len(re.findall(r'[\u0900-\u097F]', text))
-        if devanagari_chars > 0:
-            # High score if significant Devanagari content
-            score += min(0.8, devanagari_chars / len(text) * 2.0)
+        devanagari_chars = len(self.devanagari_char_pattern.findall(text))
+        if devanagari_chars == 0:
+            # Every Hindi marker and pattern below is Devanagari, so none can match
+            return score
+        
+        # High score if significant Devanagari content
+        score += min(0.8, devanagari_chars / len(text) * 2.0)
         
         # Check for Hindi markers
         for marker in self.language_markers['hindi']:
@@ -126,13 +178,27 @@ class OptimizedLanguageDetector:
                 score += 0.15
         
         # Check Hindi patterns
-        for pattern in self.hindi_devanagari_patterns:
-            matches = len(re.findall(pattern, text))
-            score += matches * 0.1
+        score += len(self.devanagari_run_pattern.findall(text)) * 0.1
+        score += sum(map(text.count, self.hindi_devanagari_words)) * 0.1
+        score += len(self.hindi_phrase_pattern.findall(text)) * 0.1
         
         return min(1.0, score)
     
-    def calculate_hindi_english_score(self, text_lower: str) -> float:
+    def count_words(self, word_counts: Counter, words: frozenset) -> int:
+        """Total occurrences of any of the given words"""
+        return sum(word_counts[word] for word in words)
+    
+    def add_group_scores(self, score: float, text_lower: str, word_counts: Counter,
+                         groups: tuple, weight: float) -> float:
+        """Add weight per match to score, one (words, phrase pattern) group at a time"""
+        for words, phrase_pattern in groups:
+            matches = self.count_words(word_counts, words)
+            if phrase_pattern is not None:
+                matches += len(phrase_pattern.findall(text_lower))
+            score += matches * weight
+        return score
+    
+    def calculate_hindi_english_score(self, text_lower: str, word_counts: Counter) -> float:
         """Calculate score for Hindi written in English"""
         score = 0.0
         
@@ -141,10 +207,8 @@ class OptimizedLanguageDetector:
             if marker in text_lower:
                 score += 0.2
         
-        # Check Hindi-English patterns
-        for pattern in self.hindi_english_patterns:
-            matches = len(re.findall(pattern, text_lower))
-            score += matches * 0.15
+        # Check Hindi-English words and phrases
+        score = self.add_group_scores(score, text_lower, word_counts, self.hindi_english_groups, 0.15)
         
         # Bonus for specific constructions
         if 'ke liye' in text_lower and 'yatra' in text_lower:
@@ -152,7 +216,7 @@ class OptimizedLanguageDetector:
         
         return min(1.0, score)
     
-    def calculate_hinglish_score(self, text_lower: str) -> float:
+    def calculate_hinglish_score(self, text_lower: str, word_counts: Counter) -> float:
         """Calculate score for Hinglish (Hindi + English mix)"""
         score = 0.0
         
@@ -161,14 +225,12 @@ class OptimizedLanguageDetector:
             if marker in text_lower:
                 score += 0.2
         
-        # Check Hinglish patterns
-        for pattern in self.hinglish_patterns:
-            matches = len(re.findall(pattern, text_lower))
-            score += matches * 0.15
+        # Check Hinglish words and phrases
+        score = self.add_group_scores(score, text_lower, word_counts, self.hinglish_groups, 0.15)
         
         # Check for mixed language indicators
-        english_words = len(re.findall(r'\b(client|trip|hotel|budget|send|update)\b', text_lower))
-        hindi_words = len(re.findall(r'\b(hamare|chahiye|ke|liye|aur|dobara)\b', text_lower))
+        english_words = self.count_words(word_counts, self.mixed_english_words)
+        hindi_words = self.count_words(word_counts, self.mixed_hindi_words)
         
         if english_words > 0 and hindi_words > 0:
             # Mixed language detected
@@ -176,7 +238,7 @@ class OptimizedLanguageDetector:
         
         return min(1.0, score)
     
-    def calculate_english_score(self, text_lower: str) -> float:
+    def calculate_english_score(self, text_lower: str, word_counts: Counter) -> float:
         """Calculate score for Pure English"""
         score = 0.0
         
@@ -185,22 +247,12 @@ class OptimizedLanguageDetector:
             if marker in text_lower:
                 score += 0.15
         
-        # Check English patterns
-        for pattern in self.english_patterns:
-            matches = len(re.findall(pattern, text_lower))
-            score += matches * 0.1
+        # Check English words
+        score = self.add_group_scores(score, text_lower, word_counts, self.english_groups, 0.1)
         
         # Check for formal English structures
-        formal_patterns = [
-            r'hope\s+you.*well',
-            r'kindly\s+send',
-            r'please\s+\w+',
-            r'would\s+like\s+to',
-            r'we\s+are\s+planning'
-        ]
-        
-        for pattern in formal_patterns:
-            if re.search(pattern, text_lower):
+        for pattern in self.formal_english_patterns:
+            if pattern.search(text_lower):
                 score += 0.2
         
         return min(1.0, score)
@@ -209,8 +261,8 @@ class OptimizedLanguageDetector:
         """Enhance detection with context analysis"""
         
         # Check for script mixing
-        has_devanagari = bool(re.search(r'[\u0900-\u097F]', text))
-        has_english_chars = bool(re.search(r'[a-zA-Z]', text))
+        has_devanagari = bool(self.devanagari_char_pattern.search(text))
+        has_english_chars = bool(self.english_char_pattern.search(text))
         
         details = []
         confidence = scores[primary_language]
@@ -264,10 +316,10 @@ class OptimizedLanguageDetector:
         """Extract language-specific features for analysis"""
         
         features = {
-            'has_devanagari': bool(re.search(r'[\u0900-\u097F]', text)),
-            'has_english': bool(re.search(r'[a-zA-Z]', text)),
-            'devanagari_ratio': len(re.findall(r'[\u0900-\u097F]', text)) / len(text) if text else 0,
-            'english_ratio': len(re.findall(r'[a-zA-Z]', text)) / len(text) if text else 0,
+            'has_devanagari': bool(self.devanagari_char_pattern.search(text)),
+            'has_english': bool(self.english_char_pattern.search(text)),
+            'devanagari_ratio': len(self.devanagari_char_pattern.findall(text)) / len(text) if text else 0,
+            'english_ratio': len(self.english_char_pattern.findall(text)) / len(text) if text else 0,
         }
         
         # Count language-specific words
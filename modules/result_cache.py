@@ -0,0 +1,26 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ResultCache:
+    """
+    Small least-recently-used cache shared by the extractor, classifier and
+    language detector for results of deterministic per-email work
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if it is not cached"""
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Hashable, value: Any):
+        """Store value for key, evicting the least recently used entry when full"""
+        self.entries[key] = value
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
@@ -39,10 +39,11 @@ class LegDetail(BaseModel):
 
 
 class SingleLegInquiry(TripInquiry):
-    pass
+    inquiry_type: Literal[InquiryType.SINGLE_LEG] = InquiryType.SINGLE_LEG
 
 
 class MultiLegInquiry(TripInquiry):
+    inquiry_type: Literal[InquiryType.MULTI_LEG] = InquiryType.MULTI_LEG
     legs: List[LegDetail] = Field(..., description="Detailed per-location legs")
 
 
@@ -53,7 +54,7 @@ class ModificationDetail(BaseModel):
 
 
 class ModificationInquiry(BaseModel):
-    inquiry_type: InquiryType = Field(default=InquiryType.MODIFICATION)
+    inquiry_type: Literal[InquiryType.MODIFICATION] = InquiryType.MODIFICATION
     original_inquiry_id: str = Field(..., description="Reference to the original inquiry")
     changes: List[ModificationDetail] = Field(..., description="List of requested changes")
     deadline: Optional[str] = Field(None, description="By when to resend the updated quote")
@@ -3,6 +3,7 @@ import re
 from datetime import datetime
 from typing import Dict, Any, List
 import logging
+from logging.handlers import MemoryHandler
 import hashlib
 
 # Import optimized modules
@@ -12,15 +13,6 @@ from modules.optimized_classifier import OptimizedInquiryClassifier
 from modules.optimized_excel_generator import OptimizedExcelGenerator
 from modules.schema import InquiryType
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('optimized_travel_agent.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 class OptimizedTravelAgentProcessor:
@@ -29,6 +21,29 @@ class OptimizedTravelAgentProcessor:
     Handles: SINGLE_LEG, MULTI_LEG, MODIFICATION inquiries in English, Hindi, Hindi-English, Hinglish
     """
     
+    # Email address inside a sender header such as "Name <name@example.com>"
+    EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+    # Characters EMAIL_PATTERN never matches; a sliced address containing any
+    # of them (other than '+') goes through the pattern instead
+    ADDRESS_REJECT_PATTERN = re.compile(r'[\s:,;<>"]')
+    
+    # Common destinations recognised in subject lines, matched as whole words
+    # in one scan
+    SUBJECT_DESTINATIONS = (
+        'bali', 'singapore', 'dubai', 'maldives', 'goa', 'kerala', 'thailand',
+        'malaysia', 'japan', 'europe', 'usa', 'canada', 'australia'
+    )
+    SUBJECT_DESTINATION_PATTERN = re.compile(r'\b(' + '|'.join(SUBJECT_DESTINATIONS) + r')\b')
+    
+    # Sections scored by calculate_completeness_score
+    COMPLETENESS_REQUIRED_FIELDS = (
+        'inquiry_type', 'language_info', 'customer_details',
+        'location_details', 'traveler_details'
+    )
+    COMPLETENESS_OPTIONAL_FIELDS = (
+        'date_details', 'preference_details', 'budget_details'
+    )
+    
     def __init__(self):
         """Initialize the optimized travel agent processor"""
         self.language_detector = OptimizedLanguageDetector()
@@ -52,18 +67,20 @@ class OptimizedTravelAgentProcessor:
             body = email_data.get('body', '')
             sender = email_data.get('sender', '')
             
-            logger.info(f"Processing inquiry from: {sender}")
+            logger.info("Processing inquiry from: %s", sender)
             
             # Generate unique inquiry ID
             inquiry_id = self.generate_inquiry_id(subject, body, sender)
             
             # Step 1: Language Detection
             language_info = self.language_detector.detect_language(f"{subject} {body}")
-            logger.info(f"Language detected: {language_info['primary_language']} (confidence: {language_info['confidence']:.2f})")
+            logger.info("Language detected: %s (confidence: %.2f)",
+                        language_info['primary_language'], language_info['confidence'])
             
             # Step 2: Inquiry Classification
             classification_info = self.inquiry_classifier.classify_inquiry(body, subject)
-            logger.info(f"Inquiry type: {classification_info['type']} (confidence: {classification_info['confidence']:.2f})")
+            logger.info("Inquiry type: %s (confidence: %.2f)",
+                        classification_info['type'], classification_info['confidence'])
             
             # Step 3: Comprehensive Field Extraction
             extracted_fields = self.travel_extractor.extract_all_fields(body, subject)
@@ -76,17 +93,21 @@ class OptimizedTravelAgentProcessor:
             # Step 5: Validate and enhance data
             validated_data = self.validate_and_enhance_data(structured_data, body, subject)
             
-            logger.info(f"Successfully processed inquiry: {inquiry_id}")
+            logger.info("Successfully processed inquiry: %s", inquiry_id)
             return validated_data
             
         except Exception as e:
-            logger.error(f"Error processing inquiry: {e}")
+            logger.error("Error processing inquiry: %s", e)
             return self.create_error_response(email_data, str(e))
     
     def generate_inquiry_id(self, subject: str, body: str, sender: str) -> str:
         """Generate unique inquiry ID"""
         timestamp = str(int(time.time()))
-        content_hash = hashlib.md5(f"{subject}{body}{sender}".encode()).hexdigest()[:8]
+        # Parts are fed in turn rather than concatenated first
+        hasher = hashlib.blake2b(digest_size=4)
+        for part in (subject, body, sender):
+            hasher.update(part.encode())
+        content_hash = hasher.hexdigest()
         return f"INQ_{timestamp}_{content_hash}"
     
     def structure_extracted_data(self, fields: Dict[str, Any], classification: Dict[str, Any], 
@@ -118,16 +139,22 @@ class OptimizedTravelAgentProcessor:
         """Extract customer contact information"""
         sender = email_data.get('sender', '')
         
-        # Extract email address
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', sender)
-        email = email_match.group(0) if email_match else sender
-        
-        # Extract name (before email or from signature)
+        # Senders are either "Name <address>" or a bare address, so the
+        # address can be sliced out directly; the pattern is only a fallback
+        # for anything else
         name = 'Unknown'
         if '<' in sender:
-            name = sender.split('<')[0].strip()
-        elif '@' in sender:
-            name = sender.split('@')[0].replace('.', ' ').title()
+            name, _, address = sender.partition('<')
+            name = name.strip()
+            email = address.partition('>')[0].strip()
+        else:
+            email = sender.strip()
+            if '@' in sender:
+                name = sender.split('@')[0].replace('.', ' ').title()
+        
+        if '@' not in email or self.ADDRESS_REJECT_PATTERN.search(email):
+            email_match = self.EMAIL_PATTERN.search(sender)
+            email = email_match.group(0) if email_match else sender
         
         return {
             'email': email,
@@ -137,11 +164,14 @@ class OptimizedTravelAgentProcessor:
     
     def structure_date_details(self, fields: Dict[str, Any]) -> Dict[str, Any]:
         """Structure date and duration information"""
+        start_date = fields.get('start_date')
+        end_date = fields.get('end_date')
+        
         return {
-            'start_date': fields.get('start_date'),
-            'end_date': fields.get('end_date'),
+            'start_date': start_date,
+            'end_date': end_date,
             'duration': fields.get('total_duration'),
-            'has_specific_dates': bool(fields.get('start_date') or fields.get('end_date'))
+            'has_specific_dates': bool(start_date or end_date)
         }
     
     def structure_traveler_details(self, fields: Dict[str, Any]) -> Dict[str, Any]:
@@ -196,17 +226,17 @@ class OptimizedTravelAgentProcessor:
     
     def structure_preference_details(self, fields: Dict[str, Any]) -> Dict[str, Any]:
         """Structure preferences and requirements"""
+        hotel = fields.get('hotel_preferences')
+        meals = fields.get('meal_preferences')
+        activities = fields.get('activities', [])
+        
         return {
-            'hotel': fields.get('hotel_preferences'),
-            'meals': fields.get('meal_preferences'),
-            'activities': fields.get('activities', []),
+            'hotel': hotel,
+            'meals': meals,
+            'activities': activities,
             'flight_required': fields.get('needs_flight'),
             'special_requirements': fields.get('special_requirements'),
-            'has_preferences': bool(
-                fields.get('hotel_preferences') or 
-                fields.get('meal_preferences') or 
-                fields.get('activities')
-            )
+            'has_preferences': bool(hotel or meals or activities)
         }
     
     def structure_budget_details(self, fields: Dict[str, Any]) -> Dict[str, Any]:
@@ -274,46 +304,24 @@ class OptimizedTravelAgentProcessor:
     
     def extract_destinations_from_subject(self, subject: str) -> List[str]:
         """Extract destinations from subject line as fallback"""
-        destinations = []
-        subject_lower = subject.lower()
-        
-        # Common destinations
-        known_destinations = [
-            'bali', 'singapore', 'dubai', 'maldives', 'goa', 'kerala', 'thailand',
-            'malaysia', 'japan', 'europe', 'usa', 'canada', 'australia'
-        ]
-        
-        for dest in known_destinations:
-            if dest in subject_lower:
-                destinations.append(dest.title())
-        
-        return destinations
+        mentioned = set(self.SUBJECT_DESTINATION_PATTERN.findall(subject.lower()))
+        return [dest.title() for dest in self.SUBJECT_DESTINATIONS if dest in mentioned]
     
     def calculate_completeness_score(self, data: Dict[str, Any]) -> float:
         """Calculate completeness score for extracted data"""
-        required_fields = [
-            'inquiry_type', 'language_info', 'customer_details',
-            'location_details', 'traveler_details'
-        ]
-        
-        optional_fields = [
-            'date_details', 'preference_details', 'budget_details'
-        ]
-        
         score = 0.0
         total_possible = 100.0
         
         # Required fields (60 points)
-        for field in required_fields:
-            if data.get(field):
+        for field_data in map(data.get, self.COMPLETENESS_REQUIRED_FIELDS):
+            if field_data:
                 score += 12.0
         
         # Optional fields (40 points)
-        for field in optional_fields:
-            field_data = data.get(field, {})
+        for field_data in map(data.get, self.COMPLETENESS_OPTIONAL_FIELDS):
             if isinstance(field_data, dict):
-                # Check if field has meaningful data
-                if any(v for v in field_data.values() if v not in [None, '', [], {}]):
+                # Check if field has meaningful data (None, '', [] and {} are all falsy)
+                if any(field_data.values()):
                     score += 13.33
         
         return min(100.0, score)
@@ -332,6 +340,21 @@ class OptimizedTravelAgentProcessor:
 # Main function for testing
 def main():
     """Main function for testing the optimized agent"""
+    # Configured here rather than at import so callers keep their own handlers.
+    # File records are buffered and written in batches (immediately on errors,
+    # and on exit via logging.shutdown)
+    log_format = '%(asctime)s - %(levelname)s - %(message)s'
+    file_handler = logging.FileHandler('optimized_travel_agent.log')
+    file_handler.setFormatter(logging.Formatter(log_format))
+    logging.basicConfig(
+        level=logging.INFO,
+        format=log_format,
+        handlers=[
+            MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler),
+            logging.StreamHandler()
+        ]
+    )
+    
     processor = OptimizedTravelAgentProcessor()
     
     # Test with sample inquiries from DATA directory
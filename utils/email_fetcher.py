@@ -1,6 +1,7 @@
 # email_fetcher.py
 import base64
 import email
+import logging
 import os.path
 import pickle
 from typing import List, Dict
@@ -10,8 +11,18 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.modify"]
 
+logger = logging.getLogger(__name__)
+
+
+# Built once per process so repeated polls reuse the same client and connection
+_service = None
+
+
+def _get_gmail_service():
+    global _service
+    if _service is not None:
+        return _service
 
-def fetch_live_emails(max_results=10) -> List[Dict]:
     creds = None
     token_path = "config/token.pickle"
     credentials_path = "config/credentials.json"
@@ -29,7 +40,12 @@ def fetch_live_emails(max_results=10) -> List[Dict]:
             with open(token_path, "wb") as token:
                 pickle.dump(creds, token)
 
-    service = build("gmail", "v1", credentials=creds)
+    _service = build("gmail", "v1", credentials=creds)
+    return _service
+
+
+def fetch_live_emails(max_results=10) -> List[Dict]:
+    service = _get_gmail_service()
     results = (
         service.users()
         .messages()
@@ -43,16 +59,32 @@ def fetch_live_emails(max_results=10) -> List[Dict]:
     )
 
     messages = results.get("messages", [])
-    emails = []
+    if not messages:
+        return []
+
+    # Fetch every message in one batched HTTP round trip instead of one per email
+    msg_data_by_id = {}
 
+    def collect(request_id, response, exception):
+        if exception is not None:
+            logger.warning("Skipping message %s: %s", request_id, exception)
+            return
+        msg_data_by_id[request_id] = response
+
+    batch = service.new_batch_http_request(callback=collect)
     for msg in messages:
-        msg_id = msg["id"]
-        msg_data = (
-            service.users()
-            .messages()
-            .get(userId="me", id=msg_id, format="full")
-            .execute()
+        batch.add(
+            service.users().messages().get(userId="me", id=msg["id"], format="full"),
+            request_id=msg["id"],
         )
+    batch.execute()
+
+    emails = []
+
+    for msg in messages:
+        msg_data = msg_data_by_id.get(msg["id"])
+        if msg_data is None:
+            continue
         payload = msg_data.get("payload", {})
         headers = payload.get("headers", [])
 
@@ -71,9 +103,11 @@ def fetch_live_emails(max_results=10) -> List[Dict]:
 
         emails.append({"sender": sender, "subject": subject, "body": body})
 
-        # ✅ Mark as read
-        service.users().messages().modify(
-            userId="me", id=msg_id, body={"removeLabelIds": ["UNREAD"]}
+    # ✅ Mark every fetched message as read in a single call
+    if msg_data_by_id:
+        service.users().messages().batchModify(
+            userId="me",
+            body={"ids": list(msg_data_by_id), "removeLabelIds": ["UNREAD"]},
         ).execute()
 
     return emails